@@ -1,14 +1,122 @@
 import sys
 import re
 import os
+import bisect
+import logging
+import time
+from collections import defaultdict
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QGraphicsScene, 
                              QGraphicsView, QGraphicsItem, QMenu, QAction, 
                              QGraphicsSceneMouseEvent, QInputDialog, QFileDialog,
                              QListWidget, QDockWidget, QVBoxLayout, QWidget, 
                              QToolBar, QComboBox, QLabel, QSlider, QSpinBox,
-                             QHBoxLayout, QPushButton, QToolTip, QMessageBox)
-from PyQt5.QtCore import Qt, QPointF, QRectF, QSizeF, QDateTime
-from PyQt5.QtGui import QPen, QBrush, QColor, QPainter, QFont, QFontMetrics, QImage
+                             QHBoxLayout, QPushButton, QToolTip, QMessageBox,
+                             QGraphicsEllipseItem, QGraphicsRectItem,
+                             QGraphicsSimpleTextItem, QOpenGLWidget)
+from PyQt5.QtCore import (Qt, QPointF, QRectF, QSizeF, QDateTime,
+                          QSignalBlocker, QCoreApplication, QTimer)
+from PyQt5.QtGui import (QPen, QBrush, QColor, QPainter, QFont, QFontMetrics,
+                         QImage, QSurfaceFormat)
+
+
+# Parser debug output goes through logging so the argument formatting (and
+# the stdio writes) are skipped entirely unless a handler is enabled -
+# printing per module was the dominant cost when loading big IP libraries
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+
+# Optional DFA regex engine. google-re2 matches in guaranteed linear time
+# with no backtracking blowups, which matters because SV files are often
+# machine-generated and huge. None of the patterns here need backreferences,
+# so it's a drop-in when installed; plain re is the fallback.
+try:
+    import re2 as _re_engine
+except ImportError:
+    _re_engine = re
+
+
+def _compile(pattern, flags=0):
+    """Compile with the DFA engine when available, falling back to re for
+    any pattern it can't handle"""
+    if _re_engine is not re:
+        try:
+            return _re_engine.compile(pattern, flags)
+        except Exception:
+            pass
+    return re.compile(pattern, flags)
+
+
+# Precompiled regex patterns - compiling these once up front instead of passing
+# string literals to re.search/re.sub on every call keeps the hot parse loops
+# out of re's internal cache lookup
+# Single alternation for both comment styles so stripping is one pass.
+# //[^\n]* instead of //.*?\n - the lazy version backtracks pointlessly and
+# misses a comment on the last line of a file with no trailing newline
+_COMMENT_RE = _compile(r'//[^\n]*|/\*.*?\*/', re.DOTALL)
+# Matches a module header plus everything after it. The file is pre-split at
+# endmodule boundaries with C-level str.split, so this never needs a lazy
+# group spanning across modules; [^;]* for the port list (ports can't contain
+# semicolons) keeps the header match from backtracking either
+_MODULE_HEAD_RE = _compile(r'\bmodule\s+(\w+)\s*(?:#\s*\([^)]*\))?\s*\(([^;]*)\)\s*;([\s\S]*)')
+_WIDTH_RE = _compile(r'\[(.*?)\]')
+_PORT_NAME_RE = _compile(r'(\w+)(?:\[([^\]]+)\])?')
+_WS_RE = _compile(r'\s+')
+_PAREN_RE = _compile(r'\([^()]*\)')
+# Master token pattern for ANSI port lists: direction keywords, type
+# keywords, bracketed widths and identifiers, all recognized in one
+# finditer pass instead of cascaded per-direction probes
+_TOK_RE = _compile(r'(?P<dir>input|output|inout)\b'
+                     r'|(?P<typ>wire|reg|logic)\b'
+                     r'|\[(?P<w>[^\]]+)\]'
+                     r'|(?P<id>\w+)')
+# All three port declaration directions in one alternation so the module body
+# gets scanned once; [^\]]+ in the width group can't backtrack
+_DECL_RE = _compile(r'(?P<dir>input|output|inout)\s+(?:wire|reg|logic)?\s*(?:\[(?P<w>[^\]]+)\])?\s*(?P<ports>[\w\s,]+)\s*;')
+# Trailing "_N" instance suffix on generated module names
+_INSTANCE_SUFFIX_RE = _compile(r'_\d+$')
+# endmodule as a whole word - a plain substring split would also fire
+# inside identifiers like endmodule_helper
+_ENDMODULE_RE = _compile(r'\bendmodule\b')
+
+# Shared application font, resolved lazily once Qt is up. No font file is
+# bundled to register with QFontDatabase, so the next best thing is a single
+# cached QFont: the substitution lookup for Arial happens once instead of in
+# every widget that would otherwise construct its own copy
+_APP_FONT = None
+
+
+def _app_font():
+    """The application-wide QFont, created on first use"""
+    global _APP_FONT
+    if _APP_FONT is None:
+        _APP_FONT = QFont("Arial", 9)
+    return _APP_FONT
+
+
+# About dialog body, frozen at import so show_about never rebuilds it
+_ABOUT_HTML = """
+<h1>SystemVerilog Module Designer</h1>
+<p>A tool for designing SystemVerilog module connections graphically.</p>
+<p>Features:</p>
+<ul>
+    <li>Load existing SystemVerilog modules</li>
+    <li>Create connections with drag and drop</li>
+    <li>Generate top-level SystemVerilog file</li>
+    <li>Export design as image</li>
+</ul>
+<p>Version: 1.0</p>
+"""
+
+# Interning pool for port name strings. Large designs repeat identifiers like
+# clk/rst_n/data/valid thousands of times across modules; collapsing them to
+# one object caps memory and makes the later ==/set lookups pointer-fast
+_intern_pool = {}
+
+
+def _intern_str(s):
+    """Return the canonical copy of s, remembering it on first sight"""
+    return _intern_pool.setdefault(s, s)
 
 
 class SystemVerilogParser:
@@ -22,27 +130,36 @@ class SystemVerilogParser:
         try:
             with open(filename, 'r') as f:
                 content = f.read()
-            
-            # Remove comments
-            content = re.sub(r'//.*?\n', '\n', content)  # Remove single-line comments
-            content = re.sub(r'/\*.*?\*/', '', content, flags=re.DOTALL)  # Remove multi-line comments
-            
-            # Find module definitions
-            module_pattern = r'module\s+(\w+)\s*(?:#\s*\([^)]*\))?\s*\((.*?)\);(.*?)endmodule'
-            module_matches = re.finditer(module_pattern, content, flags=re.DOTALL)
-            
-            for module_match in module_matches:
-                module_name = module_match.group(1)
+
+            # Cheap C-level scan before firing up the regex engine at all
+            if 'module' not in content:
+                return modules
+
+            # Remove comments (single- and multi-line) in one pass. Files with
+            # no '/' byte can't contain comments, so skip the regex entirely
+            if '/' in content:
+                content = _COMMENT_RE.sub(
+                    lambda m: '\n' if m.group(0).startswith('//') else '',
+                    content)
+
+            # Find module definitions. Splitting at endmodule first means the
+            # header regex only ever sees one module's worth of text
+            for chunk in _ENDMODULE_RE.split(content):
+                module_match = _MODULE_HEAD_RE.search(chunk)
+                if not module_match:
+                    continue
+
+                module_name = sys.intern(module_match.group(1))
                 port_list_text = module_match.group(2)
                 module_body = module_match.group(3)
                 
-                print(f"\nParsing module: {module_name}")
-                
+                log.debug("Parsing module: %s", module_name)
+
                 # Parse ANSI-style port list that contains direction information
                 inputs, outputs, inouts = SystemVerilogParser.parse_ansi_port_list(port_list_text)
-                
-                print(f"  From ANSI port list - Inputs: {inputs}")
-                print(f"  From ANSI port list - Outputs: {outputs}")
+
+                log.debug("  From ANSI port list - Inputs: %s", inputs)
+                log.debug("  From ANSI port list - Outputs: %s", outputs)
                 
                 # Get all port names
                 all_port_names = inputs + outputs + inouts
@@ -50,7 +167,7 @@ class SystemVerilogParser:
                 # If no ANSI-style ports were found, try to parse as non-ANSI style
                 if not all_port_names:
                     all_port_names = SystemVerilogParser.parse_port_list(port_list_text)
-                    print(f"  From non-ANSI port list - All ports: {all_port_names}")
+                    log.debug("  From non-ANSI port list - All ports: %s", all_port_names)
                     
                     # Find port declarations in the module body for non-ANSI style
                     body_inputs, body_outputs, body_inouts = SystemVerilogParser.parse_module_body(module_body, all_port_names)
@@ -72,15 +189,13 @@ class SystemVerilogParser:
                 }
                 
                 # Debug output
-                print(f"Final Parsed module: {module_name}")
-                print(f"  Inputs: {inputs}")
-                print(f"  Outputs: {outputs}")
-                print(f"  Inouts: {inouts}")
-        
-        except Exception as e:
-            print(f"Error parsing file {filename}: {e}")
-            import traceback
-            traceback.print_exc()
+                log.debug("Final Parsed module: %s", module_name)
+                log.debug("  Inputs: %s", inputs)
+                log.debug("  Outputs: %s", outputs)
+                log.debug("  Inouts: %s", inouts)
+
+        except Exception:
+            log.exception("Error parsing file %s", filename)
         
         return modules
     
@@ -88,7 +203,7 @@ class SystemVerilogParser:
     def extract_port_width(port_decl):
         """Extract port width from a declaration"""
         # Look for width specifications like [7:0], [31:0], [WIDTH-1:0], etc.
-        width_match = re.search(r'\[(.*?)\]', port_decl)
+        width_match = _WIDTH_RE.search(port_decl)
         if width_match:
             return width_match.group(1)
         return ""
@@ -96,216 +211,82 @@ class SystemVerilogParser:
     @staticmethod
     def parse_ansi_port_list(port_list_text):
         """Parse ANSI-style port list with direction information"""
-        inputs = []
-        outputs = []
-        inouts = []
-        
-        # Clean up port list by removing extra whitespace and newlines
-        clean_port_list = re.sub(r'\s+', ' ', port_list_text).strip()
-        
-        # Extract port declarations by direction for better handling of comma-separated lists
-        input_pattern = r'input\s+(?:wire|reg|logic)?\s*(?:\[[^\]]+\])?\s*([\w\s,]+?)(?:,|\s*$|\s*(?:input|output|inout)\s+)'
-        output_pattern = r'output\s+(?:wire|reg|logic)?\s*(?:\[[^\]]+\])?\s*([\w\s,]+?)(?:,|\s*$|\s*(?:input|output|inout)\s+)'
-        inout_pattern = r'inout\s+(?:wire|reg|logic)?\s*(?:\[[^\]]+\])?\s*([\w\s,]+?)(?:,|\s*$|\s*(?:input|output|inout)\s+)'
-        
-        # Find all input port declarations
-        full_port_list = " " + clean_port_list + " " # Add space to help with regex matching
-        
-        # Process one direction at a time
-        cursor_pos = 0
-        while cursor_pos < len(full_port_list):
-            # Look for input declaration
-            if match := re.search(r'input\s+', full_port_list[cursor_pos:]):
-                start_pos = cursor_pos + match.start()
-                cursor_pos = start_pos + len(match.group())
-                
-                # Skip type if present
-                if type_match := re.search(r'^(?:wire|reg|logic)\s+', full_port_list[cursor_pos:]):
-                    cursor_pos += len(type_match.group())
-                
-                # Extract width if present
-                width = ""
-                if dim_match := re.search(r'^\s*\[(.*?)\]\s*', full_port_list[cursor_pos:]):
-                    width = dim_match.group(1)
-                    cursor_pos += len(dim_match.group())
-                
-                # Find the end of this port declaration group
-                end_pos = cursor_pos
-                bracket_depth = 0
-                
-                while end_pos < len(full_port_list):
-                    char = full_port_list[end_pos]
-                    
-                    # Track bracket depth
-                    if char == '[':
-                        bracket_depth += 1
-                    elif char == ']':
-                        bracket_depth -= 1
-                    # Look for next direction keyword or end of port list
-                    elif bracket_depth == 0 and re.search(r'^\s*(?:input|output|inout)\s+', full_port_list[end_pos:]):
-                        break
-                    
-                    end_pos += 1
-                
-                # Extract the port list
-                port_list = full_port_list[cursor_pos:end_pos].strip()
-                
-                # Handle potential trailing comma
-                if port_list.endswith(','):
-                    port_list = port_list[:-1]
-                
-                # Split by commas (outside of brackets)
-                ports = SystemVerilogParser.split_comma_list(port_list)
-                
-                # Add width to port names if present
-                if width:
-                    ports = [f"{p}[{width}]" for p in ports]
-                
-                inputs.extend(ports)
-                
-                cursor_pos = end_pos
-                continue
-            
-            # Look for output declaration
-            if match := re.search(r'output\s+', full_port_list[cursor_pos:]):
-                start_pos = cursor_pos + match.start()
-                cursor_pos = start_pos + len(match.group())
-                
-                # Skip type if present
-                if type_match := re.search(r'^(?:wire|reg|logic)\s+', full_port_list[cursor_pos:]):
-                    cursor_pos += len(type_match.group())
-                
-                # Extract width if present
+        # One tokenizer pass driving a tiny state machine: a direction keyword
+        # opens a new declaration group, type keywords are skipped, a width
+        # before the first name sticks to every name in the group, and each
+        # identifier becomes a port. Constant work per token, no slicing
+        ports_by_direction = {"input": [], "output": [], "inout": []}
+
+        # Clean up port list by removing extra whitespace and newlines so
+        # widths come out the same as the other parsing paths
+        clean_port_list = _WS_RE.sub(' ', port_list_text).strip()
+
+        current = None  # Port list of the active direction group
+        width = ""
+        group_has_name = False
+
+        for tok in _TOK_RE.finditer(clean_port_list):
+            kind = tok.lastgroup
+            if kind == 'dir':
+                current = ports_by_direction[tok.group('dir')]
                 width = ""
-                if dim_match := re.search(r'^\s*\[(.*?)\]\s*', full_port_list[cursor_pos:]):
-                    width = dim_match.group(1)
-                    cursor_pos += len(dim_match.group())
-                
-                # Find the end of this port declaration group
-                end_pos = cursor_pos
-                bracket_depth = 0
-                
-                while end_pos < len(full_port_list):
-                    char = full_port_list[end_pos]
-                    
-                    # Track bracket depth
-                    if char == '[':
-                        bracket_depth += 1
-                    elif char == ']':
-                        bracket_depth -= 1
-                    # Look for next direction keyword or end of port list
-                    elif bracket_depth == 0 and re.search(r'^\s*(?:input|output|inout)\s+', full_port_list[end_pos:]):
-                        break
-                    
-                    end_pos += 1
-                
-                # Extract the port list
-                port_list = full_port_list[cursor_pos:end_pos].strip()
-                
-                # Handle potential trailing comma
-                if port_list.endswith(','):
-                    port_list = port_list[:-1]
-                
-                # Split by commas (outside of brackets)
-                ports = SystemVerilogParser.split_comma_list(port_list)
-                
-                # Add width to port names if present
-                if width:
-                    ports = [f"{p}[{width}]" for p in ports]
-                
-                outputs.extend(ports)
-                
-                cursor_pos = end_pos
+                group_has_name = False
+            elif kind == 'typ':
                 continue
-            
-            # Look for inout declaration
-            if match := re.search(r'inout\s+', full_port_list[cursor_pos:]):
-                start_pos = cursor_pos + match.start()
-                cursor_pos = start_pos + len(match.group())
-                
-                # Skip type if present
-                if type_match := re.search(r'^(?:wire|reg|logic)\s+', full_port_list[cursor_pos:]):
-                    cursor_pos += len(type_match.group())
-                
-                # Extract width if present
-                width = ""
-                if dim_match := re.search(r'^\s*\[(.*?)\]\s*', full_port_list[cursor_pos:]):
-                    width = dim_match.group(1)
-                    cursor_pos += len(dim_match.group())
-                
-                # Find the end of this port declaration group
-                end_pos = cursor_pos
-                bracket_depth = 0
-                
-                while end_pos < len(full_port_list):
-                    char = full_port_list[end_pos]
-                    
-                    # Track bracket depth
-                    if char == '[':
-                        bracket_depth += 1
-                    elif char == ']':
-                        bracket_depth -= 1
-                    # Look for next direction keyword or end of port list
-                    elif bracket_depth == 0 and re.search(r'^\s*(?:input|output|inout)\s+', full_port_list[end_pos:]):
-                        break
-                    
-                    end_pos += 1
-                
-                # Extract the port list
-                port_list = full_port_list[cursor_pos:end_pos].strip()
-                
-                # Handle potential trailing comma
-                if port_list.endswith(','):
-                    port_list = port_list[:-1]
-                
-                # Split by commas (outside of brackets)
-                ports = SystemVerilogParser.split_comma_list(port_list)
-                
-                # Add width to port names if present
+            elif kind == 'w':
+                # A width after the first name is an array dimension on that
+                # name; the old parser stripped those, so keep ignoring them
+                if current is not None and not group_has_name:
+                    width = tok.group('w')
+            elif kind == 'id' and current is not None:
+                group_has_name = True
                 if width:
-                    ports = [f"{p}[{width}]" for p in ports]
-                
-                inouts.extend(ports)
-                
-                cursor_pos = end_pos
-                continue
-            
-            # If no match found, move to the end
-            cursor_pos = len(full_port_list)
-        
-        return inputs, outputs, inouts
+                    # Plain concat beats an f-string here - no format dispatch,
+                    # and this runs once per port on big designs
+                    current.append(_intern_str(tok.group('id') + '[' + width + ']'))
+                else:
+                    current.append(_intern_str(tok.group('id')))
+
+        return (ports_by_direction["input"], ports_by_direction["output"],
+                ports_by_direction["inout"])
     
     @staticmethod
     def split_comma_list(port_list):
         """Split a comma-separated list of ports while respecting brackets"""
+        # Fast path: no brackets (the common case) means the C-level str.split
+        # does the whole job and the char-by-char state machine is pure overhead
+        if '[' not in port_list and ']' not in port_list:
+            return [_intern_str(p.strip()) for p in port_list.split(',') if p.strip()]
+
         ports = []
-        current = ""
+        current = []  # Accumulate chars in a list to avoid O(n^2) str concat
         bracket_depth = 0
-        
+
         for char in port_list + ',':  # Add comma at end to handle the last port
             if char == '[':
                 bracket_depth += 1
-                current += char
+                current.append(char)
             elif char == ']':
                 bracket_depth -= 1
-                current += char
+                current.append(char)
             elif char == ',' and bracket_depth == 0:
-                if current.strip():
+                text = ''.join(current).strip()
+                if text:
                     # Clean up the port name - remove dimensions
-                    port_name = SystemVerilogParser.extract_port_name(current.strip())
+                    port_name = SystemVerilogParser.extract_port_name(text)
                     if port_name:
-                        ports.append(port_name)
-                current = ""
+                        ports.append(_intern_str(port_name))
+                current = []
             else:
-                current += char
-        
+                current.append(char)
+
         return ports
     
     @staticmethod
     def extract_port_name(port_text):
         """Extract just the port name from port text that might have dimensions"""
         # Remove array dimensions if present
-        port_text = re.sub(r'\[.*?\]', '', port_text)
+        port_text = _WIDTH_RE.sub('', port_text)
         
         # Return the trimmed text as the port name
         return port_text.strip()
@@ -316,10 +297,10 @@ class SystemVerilogParser:
         port_names = []
         
         # Clean up port list by removing extra whitespace and newlines
-        clean_port_list = re.sub(r'\s+', ' ', port_list_text).strip()
-        
+        clean_port_list = _WS_RE.sub(' ', port_list_text).strip()
+
         # Handle potential parameter lists in the port list
-        clean_port_list = re.sub(r'\([^()]*\)', '', clean_port_list)
+        clean_port_list = _PAREN_RE.sub('', clean_port_list)
         
         # Split by commas outside of brackets
         ports = SystemVerilogParser.split_comma_list(clean_port_list)
@@ -329,51 +310,58 @@ class SystemVerilogParser:
     @staticmethod
     def parse_module_body(module_body, port_names):
         """Parse module body to find port declarations for non-ANSI style"""
-        inputs = []
-        outputs = []
-        inouts = []
-        
-        # Extract declaration blocks by type
-        input_blocks = re.findall(r'input\s+(?:wire|reg|logic)?\s*(?:\[(.*?)\])?\s*([\w\s,]+)\s*;', module_body)
-        output_blocks = re.findall(r'output\s+(?:wire|reg|logic)?\s*(?:\[(.*?)\])?\s*([\w\s,]+)\s*;', module_body)
-        inout_blocks = re.findall(r'inout\s+(?:wire|reg|logic)?\s*(?:\[(.*?)\])?\s*([\w\s,]+)\s*;', module_body)
-        
-        # Process input blocks
-        for width, block in input_blocks:
-            ports = SystemVerilogParser.split_comma_list(block)
-            for port in ports:
-                if port in port_names and port not in inputs:
-                    if width:
-                        inputs.append(f"{port}[{width}]")
-                    else:
-                        inputs.append(port)
-        
-        # Process output blocks
-        for width, block in output_blocks:
-            ports = SystemVerilogParser.split_comma_list(block)
-            for port in ports:
-                if port in port_names and port not in outputs:
-                    if width:
-                        outputs.append(f"{port}[{width}]")
-                    else:
-                        outputs.append(port)
-        
-        # Process inout blocks
-        for width, block in inout_blocks:
-            ports = SystemVerilogParser.split_comma_list(block)
+        # One finditer pass over the body with the combined direction
+        # alternation instead of three separate findall scans, and set-based
+        # membership tests instead of rescanning the result lists per port
+        port_name_set = set(port_names)
+        results = {"input": [], "output": [], "inout": []}
+        seen = {"input": set(), "output": set(), "inout": set()}
+
+        for match in _DECL_RE.finditer(module_body):
+            direction = match.group('dir')
+            width = match.group('w')
+            ports = SystemVerilogParser.split_comma_list(match.group('ports'))
+
             for port in ports:
-                if port in port_names and port not in inouts:
+                if port in port_name_set and port not in seen[direction]:
+                    seen[direction].add(port)
                     if width:
-                        inouts.append(f"{port}[{width}]")
+                        results[direction].append(_intern_str(port + '[' + width + ']'))
                     else:
-                        inouts.append(port)
-        
-        return inputs, outputs, inouts
+                        results[direction].append(port)
+
+        return results["input"], results["output"], results["inout"]
 
 
 class ModuleItem(QGraphicsItem):
     """Represents a SystemVerilog module in the design canvas"""
-    
+
+    # Shared font metrics plus a per-string pixel-width cache. Building a
+    # QFontMetrics and crossing into Qt for every width query on every
+    # recalculation/repaint adds up fast; port names repeat heavily across
+    # modules so the cache hit rate is high. Only valid while the font below
+    # never changes (it doesn't - the app font is fixed at startup).
+    _FONT = None
+    _METRICS = None
+    _WIDTH_CACHE = {}
+
+    @classmethod
+    def _metrics(cls):
+        """Shared QFontMetrics, created on first use"""
+        if cls._METRICS is None:
+            cls._FONT = _app_font()
+            cls._METRICS = QFontMetrics(cls._FONT)
+        return cls._METRICS
+
+    @classmethod
+    def _text_width(cls, text):
+        """Pixel width of text using the shared metrics, cached per string"""
+        width = cls._WIDTH_CACHE.get(text)
+        if width is None:
+            width = cls._metrics().width(text)
+            cls._WIDTH_CACHE[text] = width
+        return width
+
     def __init__(self, name, ports=None, parent=None):
         super().__init__(parent)
         self.name = name
@@ -381,35 +369,72 @@ class ModuleItem(QGraphicsItem):
         self.port_widths = {}  # Store register widths for each port
         self.setFlag(QGraphicsItem.ItemIsMovable)
         self.setFlag(QGraphicsItem.ItemIsSelectable)
+        # Needed so itemChange sees position changes and can drop the
+        # scene-coordinate port cache
+        self.setFlag(QGraphicsItem.ItemSendsGeometryChanges)
         self.setAcceptHoverEvents(True)  # Enable hover events for tooltips
-        
+
+        # port -> QPointF in scene coords, rebuilt lazily after each move
+        self._scene_port_cache = None
+        # Wires touching this module (kept by WireItem); created before the
+        # flags above can trigger itemChange
+        self._incident_wires = set()
+
+        # Hover highlight is a tiny child item moved over the hovered port
+        # so highlighting never forces the other children to re-render
+        self._highlight_ring = QGraphicsEllipseItem(self)
+        self._highlight_ring.setBrush(QBrush(Qt.yellow))
+        self._highlight_ring.setZValue(1)  # Above the port bubbles
+        self._highlight_ring.setAcceptedMouseButtons(Qt.NoButton)
+        self._highlight_ring.hide()
+
         # Default module dimensions
         self.min_width = 150  # Increased to accommodate register widths
         self.max_text_length = 15  # Default max characters to display
         self.port_spacing = 15
         self.port_radius = 5
         self.text_margin = 15
-        
+
+        # Cache of per-port label data: (truncated name, width text, name px,
+        # width px). Recomputing these on every paint dominated repaint cost
+        self._label_cache = {}
+
         # Parse port names to extract register widths
         self.parse_port_widths()
         
         # Calculate the width based on port names
         self.recalculate_dimensions()
         
-        self.port_positions = {}  # Will store positions of ports for connections
+        # port_positions/_port_index are built by recalculate_dimensions above
         self.highlight_port = None
         self.drag_start_pos = None  # Track drag position
     
+    def _invalidate_labels(self):
+        """Drop cached label data after ports or truncation length change"""
+        self._label_cache.clear()
+
+    def _port_label(self, port):
+        """Cached (truncated name, width text, name px, width px) for a port"""
+        label = self._label_cache.get(port)
+        if label is None:
+            truncated = self.truncate_text(port)
+            width_text = f"[{self.port_widths[port]}]" if self.port_widths.get(port, "") else ""
+            label = (truncated, width_text, self._text_width(truncated),
+                     self._text_width(width_text) if width_text else 0)
+            self._label_cache[port] = label
+        return label
+
     def parse_port_widths(self):
         """Extract register widths from port names"""
         # Format expected: portname[width]
         # Example: data[31:0] or addr[7:0]
-        
+        self._invalidate_labels()
+
         for port_type in ["inputs", "outputs"]:
             new_ports = []
             for port in self.ports[port_type]:
                 # Check if port has width information
-                match = re.search(r'(\w+)(?:\[([^\]]+)\])?', port)
+                match = _PORT_NAME_RE.search(port)
                 if match:
                     port_name = match.group(1)
                     width = match.group(2) if match.group(2) else ""
@@ -433,52 +458,56 @@ class ModuleItem(QGraphicsItem):
             self.drag_start_pos = event.pos()
             super().mousePressEvent(event)
     
-    def mouseMoveEvent(self, event):
-        """Handle mouse move events"""
-        super().mouseMoveEvent(event)
-        # Update connected wires when the module is moved
-        scene = self.scene()
-        if scene:
-            for wire in scene.wires:
-                if wire.start_module == self:
-                    wire.start_pos = self.mapToScene(self.port_positions[wire.start_port])
-                    wire.update()
-                if wire.end_module == self:
-                    wire.end_pos = self.mapToScene(self.port_positions[wire.end_port])
-                    wire.update()
+    def itemChange(self, change, value):
+        if change == QGraphicsItem.ItemPositionHasChanged:
+            # This fires for every moved item - unlike mouse events, which
+            # only reach the grabbed module when a rubber-band selection is
+            # dragged as a group
+            self._scene_port_cache = None
+            # Only the wires incident to this module need touching, not
+            # every wire in the scene; they re-derive their endpoints
+            # lazily on the next paint
+            for wire in self._incident_wires:
+                wire.invalidate_geometry()
+                wire.update()
+            # Moving a module also changes the scene's bounding box
+            scene = self.scene()
+            if scene is not None:
+                scene._bbox_dirty = True
+        return super().itemChange(change, value)
+
+    def scene_port_positions(self):
+        """Port positions mapped to scene coordinates, cached per position.
+
+        The module's transform is constant between moves, so the mapping is
+        done once instead of per port on every mouse event.
+        """
+        if self._scene_port_cache is None:
+            self._scene_port_cache = {port: self.mapToScene(pos)
+                                      for port, pos in self.port_positions.items()}
+        return self._scene_port_cache
     
     def recalculate_dimensions(self):
         """Calculate dimensions based on current settings"""
-        # Get font metrics to calculate text widths
-        font = QFont("Arial", 9)
-        metrics = QFontMetrics(font)
-        
         # Calculate the width needed for input ports (including register width)
+        # This also warms the label cache so paint never measures text itself
         input_width = 0
         for port in self.ports["inputs"]:
-            # Calculate port name width (truncated if needed)
-            port_text = self.truncate_text(port)
-            port_width = metrics.width(port_text)
-            
-            # Add width text if available
-            width_text = f"[{self.port_widths[port]}]" if self.port_widths.get(port, "") else ""
+            _, width_text, name_px, width_px = self._port_label(port)
+            port_width = name_px
             if width_text:
-                port_width += metrics.width(width_text) + 5  # Add extra spacing
-            
+                port_width += width_px + 5  # Add extra spacing
+
             input_width = max(input_width, port_width)
-        
+
         # Calculate the width needed for output ports (including register width)
         output_width = 0
         for port in self.ports["outputs"]:
-            # Calculate port name width (truncated if needed)
-            port_text = self.truncate_text(port)
-            port_width = metrics.width(port_text)
-            
-            # Add width text if available
-            width_text = f"[{self.port_widths[port]}]" if self.port_widths.get(port, "") else ""
+            _, width_text, name_px, width_px = self._port_label(port)
+            port_width = name_px
             if width_text:
-                port_width += metrics.width(width_text) + 5  # Add extra spacing
-            
+                port_width += width_px + 5  # Add extra spacing
+
             output_width = max(output_width, port_width)
         
         # Set module width based on port names and width information
@@ -488,16 +517,60 @@ class ModuleItem(QGraphicsItem):
         # Calculate height based on number of ports
         port_count = max(len(self.ports["inputs"]), len(self.ports["outputs"]))
         self.height = max(80, 30 + self.port_spacing * port_count)
-    
+
+        # Rebuild the parallel port arrays used for hit testing and painting.
+        # Port layout is fixed by index, so these mirror what paint draws and
+        # paint itself never has to compute or store positions
+        y_offset = 30
+        self._input_ports = list(self.ports["inputs"])
+        self._input_ys = [y_offset + i * self.port_spacing + self.port_radius
+                          for i in range(len(self._input_ports))]
+        self._output_ports = list(self.ports["outputs"])
+        self._output_ys = [y_offset + i * self.port_spacing + self.port_radius
+                           for i in range(len(self._output_ports))]
+
+        # Set mirrors of the port lists for O(1) membership tests; the
+        # ordered lists stay authoritative for layout and SV emission
+        self._inputs_set = set(self._input_ports)
+        self._outputs_set = set(self._output_ports)
+
+        # Name -> (side, index) map for external lookups (wires, highlight)
+        self._port_index = {}
+        self.port_positions = {}
+        for i, port in enumerate(self._input_ports):
+            self._port_index[port] = ("input", i)
+            self.port_positions[port] = QPointF(0, self._input_ys[i])
+        for i, port in enumerate(self._output_ports):
+            self._port_index[port] = ("output", i)
+            self.port_positions[port] = QPointF(self.width, self._output_ys[i])
+
+        # Local port layout changed, so any mapped scene positions are stale
+        self._scene_port_cache = None
+
+        # Recreate the child items that render the module at the new geometry
+        self._rebuild_children()
+
+        # The ports just moved, so wires anchored to them and the scene's
+        # bounding box are stale as well
+        for wire in self._incident_wires:
+            wire.invalidate_geometry()
+            wire.update()
+        scene = self.scene()
+        if scene is not None:
+            scene._bbox_dirty = True
+
     def set_max_text_length(self, length):
         """Set the maximum text length to display"""
         self.max_text_length = length
+        self._invalidate_labels()
+        self.prepareGeometryChange()  # The bounding rect is about to change
         self.recalculate_dimensions()
         self.update()
-    
+
     def set_port_spacing(self, spacing):
         """Set the spacing between ports"""
         self.port_spacing = spacing
+        self.prepareGeometryChange()  # The bounding rect is about to change
         self.recalculate_dimensions()
         self.update()
     
@@ -510,118 +583,169 @@ class ModuleItem(QGraphicsItem):
             return text[:self.max_text_length-3] + "..."
         return text
     
-    def paint(self, painter, option, widget):
-        # Draw module box
-        painter.setPen(QPen(Qt.black, 2))
-        painter.setBrush(QBrush(QColor(220, 220, 255)))
-        painter.drawRect(0, 0, self.width, self.height)
-        
-        # Draw module name
-        font = painter.font()
-        font.setBold(True)
-        painter.setFont(font)
-        painter.drawText(10, 20, self.name)
-        font.setBold(False)
-        painter.setFont(font)
-        
-        # Draw input ports on left side
-        y_offset = 30
-        for i, port in enumerate(self.ports["inputs"]):
-            pos_y = y_offset + i * self.port_spacing
-            
-            # Highlight port if it's being hovered
-            if self.highlight_port == port:
-                painter.setBrush(QBrush(Qt.yellow))
-                painter.setPen(QPen(Qt.red, 2))
-            else:
-                painter.setBrush(QBrush(Qt.red))
-                painter.setPen(QPen(Qt.black, 2))
-                
-            painter.drawEllipse(0, pos_y, self.port_radius * 2, self.port_radius * 2)
-            
-            # Draw truncated port name
-            truncated_port = self.truncate_text(port)
-            painter.drawText(self.text_margin, pos_y + 8, truncated_port)
-            
-            # Draw port width if available
-            if self.port_widths.get(port, ""):
-                width_text = f"[{self.port_widths[port]}]"
-                painter.setPen(QPen(QColor(100, 100, 100)))
-                painter.drawText(self.text_margin + painter.fontMetrics().width(truncated_port) + 5, 
-                               pos_y + 8, width_text)
-                painter.setPen(QPen(Qt.black))
-            
-            self.port_positions[port] = QPointF(0, pos_y + self.port_radius)
-            
-        # Draw output ports on right side
-        for i, port in enumerate(self.ports["outputs"]):
-            pos_y = y_offset + i * self.port_spacing
-            
-            # Highlight port if it's being hovered
-            if self.highlight_port == port:
-                painter.setBrush(QBrush(Qt.yellow))
-                painter.setPen(QPen(Qt.green, 2))
-            else:
-                painter.setBrush(QBrush(Qt.green))
-                painter.setPen(QPen(Qt.black, 2))
-                
-            painter.drawEllipse(self.width - self.port_radius * 2, pos_y, 
-                               self.port_radius * 2, self.port_radius * 2)
-            
-            # Draw truncated port name
-            truncated_port = self.truncate_text(port)
-            
-            # Calculate width of port name for alignment
-            text_width = painter.fontMetrics().width(truncated_port)
-            
-            # Calculate width of port width text if available
-            width_text = f"[{self.port_widths[port]}]" if self.port_widths.get(port, "") else ""
-            width_text_width = painter.fontMetrics().width(width_text)
-            
-            # Position for port name
-            text_x = self.width - text_width - self.text_margin - width_text_width - 5
+    def _rebuild_children(self):
+        """(Re)build the child items that actually render the module.
+
+        Geometry gets set once here instead of being recomputed in paint, so
+        Qt only redraws the children whose rects go dirty rather than running
+        a big custom paint for the whole module on every repaint."""
+        scene = self.scene()
+        for child in self.childItems():
+            if child is self._highlight_ring:
+                continue
+            child.setParentItem(None)
+            if scene is not None:
+                scene.removeItem(child)
+
+        # Module box
+        body = QGraphicsRectItem(0, 0, self.width, self.height, self)
+        body.setPen(QPen(Qt.black, 2))
+        body.setBrush(QBrush(QColor(220, 220, 255)))
+        body.setAcceptedMouseButtons(Qt.NoButton)
+
+        ascent = self._metrics().ascent()
+
+        # Module name in bold
+        name_item = QGraphicsSimpleTextItem(self.name, self)
+        name_font = QFont(self._FONT)
+        name_font.setBold(True)
+        name_item.setFont(name_font)
+        name_item.setPos(10, 20 - ascent)
+        name_item.setAcceptedMouseButtons(Qt.NoButton)
+
+        gray = QBrush(QColor(100, 100, 100))
+        black_pen = QPen(Qt.black, 2)
+        diameter = self.port_radius * 2
+
+        # Input ports on the left side
+        for i, port in enumerate(self._input_ports):
+            pos_y = self._input_ys[i] - self.port_radius
+            truncated_port, width_text, name_px, _ = self._port_label(port)
+
+            bubble = QGraphicsEllipseItem(0, pos_y, diameter, diameter, self)
+            bubble.setPen(black_pen)
+            bubble.setBrush(QBrush(Qt.red))
+            bubble.setAcceptedMouseButtons(Qt.NoButton)
+
+            label = QGraphicsSimpleTextItem(truncated_port, self)
+            label.setFont(self._FONT)
+            label.setPos(self.text_margin, pos_y + 8 - ascent)
+            label.setAcceptedMouseButtons(Qt.NoButton)
+
+            if width_text:
+                width_label = QGraphicsSimpleTextItem(width_text, self)
+                width_label.setFont(self._FONT)
+                width_label.setBrush(gray)
+                width_label.setPos(self.text_margin + name_px + 5,
+                                   pos_y + 8 - ascent)
+                width_label.setAcceptedMouseButtons(Qt.NoButton)
+
+        # Output ports on the right side
+        for i, port in enumerate(self._output_ports):
+            pos_y = self._output_ys[i] - self.port_radius
+            truncated_port, width_text, name_px, width_px = self._port_label(port)
+
+            bubble = QGraphicsEllipseItem(self.width - diameter, pos_y,
+                                          diameter, diameter, self)
+            bubble.setPen(black_pen)
+            bubble.setBrush(QBrush(Qt.green))
+            bubble.setAcceptedMouseButtons(Qt.NoButton)
+
+            # Right-align the name, leaving room for the width text
+            text_x = self.width - name_px - self.text_margin - width_px - 5
             if width_text:
                 text_x -= 5  # Additional spacing if width is present
-            
-            painter.drawText(text_x, pos_y + 8, truncated_port)
-            
-            # Draw port width if available
+
+            label = QGraphicsSimpleTextItem(truncated_port, self)
+            label.setFont(self._FONT)
+            label.setPos(text_x, pos_y + 8 - ascent)
+            label.setAcceptedMouseButtons(Qt.NoButton)
+
             if width_text:
-                painter.setPen(QPen(QColor(100, 100, 100)))
-                painter.drawText(self.width - width_text_width - self.text_margin, 
-                               pos_y + 8, width_text)
-                painter.setPen(QPen(Qt.black))
-            
-            self.port_positions[port] = QPointF(self.width, pos_y + self.port_radius)
+                width_label = QGraphicsSimpleTextItem(width_text, self)
+                width_label.setFont(self._FONT)
+                width_label.setBrush(gray)
+                width_label.setPos(self.width - width_px - self.text_margin,
+                                   pos_y + 8 - ascent)
+                width_label.setAcceptedMouseButtons(Qt.NoButton)
+
+        # The children do all the painting (ModuleItem.paint is a no-op),
+        # so the raster cache goes on them - cache modes aren't inherited
+        # from the parent item
+        for child in self.childItems():
+            child.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+
+    def paint(self, painter, option, widget):
+        # Rendering is handled entirely by the child items built in
+        # _rebuild_children; QGraphicsItem.paint is abstract so this stays
+        # as a required no-op
+        pass
     
     def find_port_at_position(self, pos):
         """Find if a port exists at the given position"""
-        for port, port_pos in self.port_positions.items():
-            if (port_pos - pos).manhattanLength() < 10:
-                return port
+        # Ports only live on the left (inputs) and right (outputs) edges with
+        # ascending y, so a binary search on y replaces scanning every port -
+        # this runs on every hover/drag mouse move
+        x = pos.x()
+        if x < 10:
+            ys, names = self._input_ys, self._input_ports
+            dx = abs(x)  # input ports sit at x == 0
+        elif x > self.width - 10:
+            ys, names = self._output_ys, self._output_ports
+            dx = abs(self.width - x)
+        else:
+            return None
+
+        y = pos.y()
+        idx = bisect.bisect_left(ys, y)
+        for i in (idx - 1, idx):
+            if 0 <= i < len(ys) and dx + abs(y - ys[i]) < 10:
+                return names[i]
         return None
     
+    def _move_highlight_ring(self, port):
+        """Position the highlight overlay over a port, or hide it"""
+        if port is None:
+            self._highlight_ring.hide()
+            return
+
+        diameter = self.port_radius * 2
+        side, i = self._port_index[port]
+        if side == "input":
+            self._highlight_ring.setPen(QPen(Qt.red, 2))
+            self._highlight_ring.setRect(0, self._input_ys[i] - self.port_radius,
+                                         diameter, diameter)
+        else:
+            self._highlight_ring.setPen(QPen(Qt.green, 2))
+            self._highlight_ring.setRect(self.width - diameter,
+                                         self._output_ys[i] - self.port_radius,
+                                         diameter, diameter)
+        self._highlight_ring.show()
+
     def hoverMoveEvent(self, event):
         """Handle hover move events for port highlighting"""
         port = self.find_port_at_position(event.pos())
         if port != self.highlight_port:
             self.highlight_port = port
-            self.update()
-            
+
+            # Move the overlay instead of repainting the module, so the
+            # children's cached rasters stay valid while the mouse wanders
+            self._move_highlight_ring(port)
+
             # Show tooltip with full port name and width if hovering over a port
             if port:
                 width_text = f" [{self.port_widths[port]}]" if self.port_widths.get(port, "") else ""
-                port_type = "Input" if port in self.ports["inputs"] else "Output"
+                port_type = "Input" if port in self._inputs_set else "Output"
                 tooltip = f"{port_type}: {port}{width_text}"
                 QToolTip.showText(event.screenPos(), tooltip)
-            
+
         super().hoverMoveEvent(event)
-    
+
     def hoverLeaveEvent(self, event):
         """Handle hover leave events"""
         if self.highlight_port:
             self.highlight_port = None
-            self.update()
+            self._highlight_ring.hide()
         super().hoverLeaveEvent(event)
 
 
@@ -638,29 +762,57 @@ class WireItem(QGraphicsItem):
         self.end_pos = end_pos
         self.setAcceptHoverEvents(True)  # Enable hover events for tooltips
         self.hover = False
-        
+
+        # Cached scene-coordinate endpoints and bounding rect, recomputed only
+        # after invalidate_geometry() - Qt queries boundingRect constantly
+        self._cached_endpoints = None
+        self._cached_rect = None
+
+        # Register with both endpoint modules so they can update just their
+        # own wires while being dragged
+        start_module._incident_wires.add(self)
+        end_module._incident_wires.add(self)
+
+    def invalidate_geometry(self):
+        """Force endpoint positions and bounding rect to be re-derived"""
+        self._cached_endpoints = None
+        self._cached_rect = None
+
+    def detach(self):
+        """Unregister from the endpoint modules before removal from the scene"""
+        self.start_module._incident_wires.discard(self)
+        self.end_module._incident_wires.discard(self)
+
+    def _endpoints(self):
+        """Current endpoint positions in scene coordinates, cached until one
+        of the connected modules moves"""
+        if self._cached_endpoints is None:
+            start_pos = self.start_module.mapToScene(self.start_module.port_positions[self.start_port])
+            end_pos = self.end_module.mapToScene(self.end_module.port_positions[self.end_port])
+            self._cached_endpoints = (start_pos, end_pos)
+
+            x = min(start_pos.x(), end_pos.x())
+            y = min(start_pos.y(), end_pos.y())
+            width = abs(end_pos.x() - start_pos.x())
+            height = abs(end_pos.y() - start_pos.y())
+            self._cached_rect = QRectF(x, y, width, height).adjusted(-5, -5, 5, 5)
+
+        return self._cached_endpoints
+
     def boundingRect(self):
-        """Create a bounding rectangle that dynamically encompasses the wire"""
-        # Use current positions rather than stored positions
-        start_pos = self.start_module.mapToScene(self.start_module.port_positions[self.start_port])
-        end_pos = self.end_module.mapToScene(self.end_module.port_positions[self.end_port])
-        
-        x = min(start_pos.x(), end_pos.x())
-        y = min(start_pos.y(), end_pos.y())
-        width = abs(end_pos.x() - start_pos.x())
-        height = abs(end_pos.y() - start_pos.y())
-        return QRectF(x, y, width, height).adjusted(-5, -5, 5, 5)
-    
+        """Bounding rectangle that dynamically encompasses the wire"""
+        self._endpoints()
+        return self._cached_rect
+
     def paint(self, painter, option, widget):
         """Paint the wire using current module positions"""
-        # Get current positions from modules
-        start_pos = self.start_module.mapToScene(self.start_module.port_positions[self.start_port])
-        end_pos = self.end_module.mapToScene(self.end_module.port_positions[self.end_port])
-        
+        # Get current positions from modules (shared with boundingRect)
+        start_pos, end_pos = self._endpoints()
+
         # Update stored positions
         self.start_pos = start_pos
         self.end_pos = end_pos
-        
+
         if self.hover:
             # Highlight wire when hovered
             painter.setPen(QPen(Qt.red, 3))
@@ -686,73 +838,225 @@ class WireItem(QGraphicsItem):
 
 class DesignCanvas(QGraphicsScene):
     """The main canvas where modules and wires are placed and manipulated"""
-    
+
+    # Shared pen for the rubber-band line; built lazily once Qt is up so we
+    # don't pay a QPen constructor on every wire-drawing click
+    _DASH_PEN = None
+
     def __init__(self):
         super().__init__()
+        if DesignCanvas._DASH_PEN is None:
+            DesignCanvas._DASH_PEN = QPen(Qt.DashLine)
         self.modules = {}  # Store module objects by name
-        self.wires = []    # Store wire connections
+        self.wires = []    # Store wire connections (iteration order)
+        self._wire_set = set()  # Same wires, for O(1) membership
+
+        # Next free instance number per module type, so naming a new
+        # instance doesn't probe every taken suffix again
+        self._name_counters = defaultdict(int)
+
+        # True once the design has unsaved mutations; lets a clean close
+        # skip the confirmation prompt entirely
+        self._dirty = False
+
+        # Hashed wire lookups so connection checks and deletions don't have
+        # to scan the whole wire list (that went quadratic on big designs)
+        self.wires_by_module = defaultdict(set)    # id(module) -> wires touching it
+        self.wires_by_endport = {}                 # (id(module), port) -> wire
+        self.wires_by_startport = defaultdict(list)  # (id(module), port) -> wires
+
         self.drawing_wire = False
         self.start_module = None
         self.start_port = None
         self.start_pos = None
+        self.start_is_output = False
         self.temp_line = None
+
+        # The main window points this at statusBar().showMessage; default
+        # keeps the canvas usable without a window
+        self.status_callback = lambda message, timeout=0: None
+        self._last_move_t = 0.0  # Throttles temp-line updates while drawing
+
+        # Cached itemsBoundingRect - recomputing it walks every item in the
+        # scene, so keep the last answer until something is added, removed
+        # or dragged
+        self._bbox_dirty = True
+        self._cached_bbox = None
+
+        # Context menu built once; the handler only toggles action
+        # visibility instead of reconstructing the menu per right-click
+        self._ctx_menu = QMenu()
+        self._add_module_action = self._ctx_menu.addAction("Add Module")
+        self._delete_action = self._ctx_menu.addAction("Delete Selected")
+
         self.setSceneRect(-5000, -5000, 10000, 10000)  # Large canvas area
+
+    def addItem(self, item):
+        self._bbox_dirty = True
+        super().addItem(item)
+
+    def removeItem(self, item):
+        self._bbox_dirty = True
+        super().removeItem(item)
+
+    def clear_design(self):
+        """Remove everything and reset all bookkeeping in one pass.
+
+        The BSP index is disabled while clearing - otherwise Qt updates
+        the tree for every single item removal, which goes quadratic on
+        large designs.
+        """
+        self.setItemIndexMethod(QGraphicsScene.NoIndex)
+        try:
+            self.clear()
+        finally:
+            self.setItemIndexMethod(QGraphicsScene.BspTreeIndex)
+        self.modules.clear()
+        self.wires.clear()
+        self._wire_set.clear()
+        self.wires_by_module.clear()
+        self.wires_by_endport.clear()
+        self.wires_by_startport.clear()
+        self._name_counters.clear()
+        self._bbox_dirty = True
+        self._cached_bbox = None
+        self.drawing_wire = False
+        self.temp_line = None  # clear() already deleted the item
+        self._dirty = False
+
+    def next_instance_name(self, base):
+        """Unique instance name for a module type in amortized O(1).
+
+        The per-type counter remembers where the last search ended; the
+        loop only advances past names the user claimed by other means.
+        """
+        count = self._name_counters[base]
+        name = base if count == 0 else f"{base}_{count}"
+        while name in self.modules:
+            count += 1
+            name = f"{base}_{count}"
+        self._name_counters[base] = count + 1
+        return name
+
+    def add_modules_bulk(self, modules):
+        """Add many ModuleItems at once without reindexing per item.
+
+        Dropping to NoIndex while populating keeps Qt from rebuilding the
+        BSP tree after every addItem; one rebuild happens when the index
+        method is restored, followed by a single repaint.
+        """
+        self.blockSignals(True)
+        self.setItemIndexMethod(QGraphicsScene.NoIndex)
+        try:
+            for module in modules:
+                self.addItem(module)
+                self.modules[module.name] = module
+                self._dirty = True
+        finally:
+            self.setItemIndexMethod(QGraphicsScene.BspTreeIndex)
+            self.blockSignals(False)
+        self.update()
+
+    def items_bounding_rect_cached(self):
+        """Bounding rect of all items, recomputed only when stale"""
+        if self._bbox_dirty or self._cached_bbox is None:
+            self._cached_bbox = super().itemsBoundingRect()
+            self._bbox_dirty = False
+        return self._cached_bbox
     
+    def _modules_near(self, scene_pos, radius=10):
+        """Modules with items within radius px of a scene position, found
+        through the scene's BSP index instead of probing every module"""
+        probe = QRectF(scene_pos.x() - radius, scene_pos.y() - radius,
+                       radius * 2, radius * 2)
+        found = []
+        for item in self.items(probe):
+            # Modules render through child items, so walk up to the ModuleItem
+            while item is not None and not isinstance(item, ModuleItem):
+                item = item.parentItem()
+            if item is not None and item not in found:
+                found.append(item)
+        return found
+
+    def _register_wire(self, wire):
+        """Add a wire to the hashed lookup indices"""
+        self.wires_by_module[id(wire.start_module)].add(wire)
+        self.wires_by_module[id(wire.end_module)].add(wire)
+        self.wires_by_endport[(id(wire.end_module), wire.end_port)] = wire
+        self.wires_by_startport[(id(wire.start_module), wire.start_port)].append(wire)
+
+    def _unregister_wire(self, wire):
+        """Remove a wire from the hashed lookup indices"""
+        self.wires_by_module[id(wire.start_module)].discard(wire)
+        self.wires_by_module[id(wire.end_module)].discard(wire)
+        self.wires_by_endport.pop((id(wire.end_module), wire.end_port), None)
+        start_wires = self.wires_by_startport.get((id(wire.start_module), wire.start_port))
+        if start_wires and wire in start_wires:
+            start_wires.remove(wire)
+
     def get_module_type(self, module_name):
         """Get the original module type from the instance name"""
-        if '_' in module_name and module_name.split('_')[-1].isdigit():
-            return '_'.join(module_name.split('_')[:-1])
-        return module_name
+        return _INSTANCE_SUFFIX_RE.sub('', module_name)
     
     def contextMenuEvent(self, event):
         """Show context menu"""
-        menu = QMenu()
-        
-        # Add global actions
-        add_module_action = menu.addAction("Add Module")
-        delete_action = None
-        
-        # Add actions for selected items
-        selected_items = self.selectedItems()
-        if selected_items:
-            delete_action = menu.addAction("Delete Selected")
-        
-        action = menu.exec_(event.screenPos())
-        
-        # Handle menu actions
-        if action == add_module_action:
-            # Signal main window to show add module dialog
-            main_window = self.views()[0].window()
-            main_window.add_module_manually()
-        
-        elif action == delete_action:
-            self.delete_selected_items()
+        # Only offer deletion when something is selected
+        self._delete_action.setVisible(bool(self.selectedItems()))
+
+        action = self._ctx_menu.exec_(event.screenPos())
+        if action is None:
+            # Menu dismissed without picking anything
+            return
+
+        # Dict dispatch keeps this a single lookup and can't touch an
+        # action that wasn't offered
+        handler = {
+            self._add_module_action:
+                lambda: self.views()[0].window().add_module_manually(),
+            self._delete_action: self.delete_selected_items,
+        }.get(action)
+        if handler is not None:
+            handler()
     
     def delete_selected_items(self):
         """Delete selected items"""
         selected_items = self.selectedItems()
-        
+
+        # Collect doomed wires first and rebuild the wire list once at the
+        # end; calling list.remove() per wire made big deletions quadratic
+        wires_to_remove = set()
+
         for item in selected_items:
             # If it's a module
             if isinstance(item, ModuleItem):
-                # Remove all wires connected to this module
-                wires_to_remove = []
-                for wire in self.wires:
-                    if wire.start_module == item or wire.end_module == item:
-                        wires_to_remove.append(wire)
-                
-                for wire in wires_to_remove:
-                    self.wires.remove(wire)
+                # Remove all wires connected to this module - the per-module
+                # index hands them over without scanning the wire list
+                for wire in list(self.wires_by_module[id(item)]):
+                    self._unregister_wire(wire)
+                    wire.detach()
+                    wires_to_remove.add(wire)
                     self.removeItem(wire)
-                
+
+                self.wires_by_module.pop(id(item), None)
+
                 # Remove module from dictionary and scene
                 del self.modules[item.name]
                 self.removeItem(item)
-            
-            # If it's a wire
-            elif isinstance(item, WireItem):
-                self.wires.remove(item)
+
+            # If it's a wire (and its module wasn't also selected, in which
+            # case it has already been handled above)
+            elif isinstance(item, WireItem) and item not in wires_to_remove:
+                self._unregister_wire(item)
+                item.detach()
+                wires_to_remove.add(item)
                 self.removeItem(item)
+
+        if wires_to_remove:
+            self.wires = [w for w in self.wires if w not in wires_to_remove]
+            self._wire_set -= wires_to_remove
+
+        if selected_items:
+            self._dirty = True
     
     def mousePressEvent(self, event):
         """Handle mouse press events for wire creation"""
@@ -760,18 +1064,21 @@ class DesignCanvas(QGraphicsScene):
         port_clicked = False
         
         if event.button() == Qt.LeftButton:
-            # Check if user clicked on a port
-            for module in self.modules.values():
+            # Check if user clicked on a port (only modules near the cursor)
+            for module in self._modules_near(event.scenePos()):
                 port = module.find_port_at_position(module.mapFromScene(event.scenePos()))
                 if port:
                     self.drawing_wire = True
                     self.start_module = module
                     self.start_port = port
-                    self.start_pos = module.mapToScene(module.port_positions[port])
+                    # Drag direction is fixed here; the release handler only
+                    # has to look at ports of the opposite direction
+                    self.start_is_output = port in module._outputs_set
+                    self.start_pos = module.scene_port_positions()[port]
                     self.temp_line = self.addLine(
                         self.start_pos.x(), self.start_pos.y(),
                         event.scenePos().x(), event.scenePos().y(),
-                        QPen(Qt.DashLine)
+                        DesignCanvas._DASH_PEN
                     )
                     port_clicked = True
                     break
@@ -782,13 +1089,22 @@ class DesignCanvas(QGraphicsScene):
     
     def mouseMoveEvent(self, event):
         """Update temporary wire during drawing"""
+        if not self.drawing_wire:
+            # Nothing to update on a plain move - hand straight off to Qt
+            return super().mouseMoveEvent(event)
+
         super().mouseMoveEvent(event)
-        
-        if self.drawing_wire and self.temp_line:
-            self.temp_line.setLine(
-                self.start_pos.x(), self.start_pos.y(),
-                event.scenePos().x(), event.scenePos().y()
-            )
+
+        if self.temp_line:
+            # Throttle to ~120Hz - Qt delivers moves much faster than that
+            # and every setLine schedules a repaint of the rubber band
+            now = time.perf_counter()
+            if now - self._last_move_t > 0.008:
+                self._last_move_t = now
+                self.temp_line.setLine(
+                    self.start_pos.x(), self.start_pos.y(),
+                    event.scenePos().x(), event.scenePos().y()
+                )
     
     def mouseReleaseEvent(self, event):
         """Finalize wire creation"""
@@ -797,21 +1113,24 @@ class DesignCanvas(QGraphicsScene):
         if self.drawing_wire and event.button() == Qt.LeftButton:
             valid_connection = False
             
-            # Check if mouse was released on another port
-            for module in self.modules.values():
+            # Check if mouse was released on another port (again only the
+            # modules near the release point, courtesy of the BSP index)
+            for module in self._modules_near(event.scenePos()):
                 if module == self.start_module:
                     continue  # Skip self-connections
                     
-                for port, pos in module.port_positions.items():
-                    global_pos = module.mapToScene(pos)
-                    if (global_pos - event.scenePos()).manhattanLength() < 10:
-                        # Check if it's a valid connection (output -> input)
-                        if (self.start_port in self.start_module.ports["outputs"] and 
-                            port in module.ports["inputs"]):
-                            # Valid connection: output -> input
-                            valid_connection = True
-                        elif (self.start_port in self.start_module.ports["inputs"] and 
-                              port in module.ports["outputs"]):
+                release_pos = event.scenePos()
+                for port, global_pos in module.scene_port_positions().items():
+                    # Plain float math instead of building a temporary QPointF
+                    # just to call manhattanLength() on it
+                    if (abs(global_pos.x() - release_pos.x()) +
+                            abs(global_pos.y() - release_pos.y())) < 10:
+                        # Check if it's a valid connection (output -> input).
+                        # The drag direction was captured on mouse press, so
+                        # only the opposite side needs a membership test
+                        if self.start_is_output:
+                            valid_connection = port in module._inputs_set
+                        elif port in module._outputs_set:
                             # Valid connection: input <- output (reverse connection)
                             valid_connection = True
                             # Swap start and end for correct direction
@@ -823,14 +1142,11 @@ class DesignCanvas(QGraphicsScene):
                             # Check if the input port is already connected
                             # Note: we allow multiple connections to the same output
                             input_already_connected = False
-                            
+
                             # If we're connecting to an input port, check if it's already connected
-                            if port in module.ports["inputs"]:
-                                for wire in self.wires:
-                                    if wire.end_module == module and wire.end_port == port:
-                                        input_already_connected = True
-                                        break
-                            
+                            if port in module._inputs_set:
+                                input_already_connected = (id(module), port) in self.wires_by_endport
+
                             if not input_already_connected:
                                 # Create permanent wire
                                 wire = WireItem(
@@ -843,12 +1159,16 @@ class DesignCanvas(QGraphicsScene):
                                 )
                                 self.addItem(wire)
                                 self.wires.append(wire)
+                                self._wire_set.add(wire)
+                                self._register_wire(wire)
+                                self._dirty = True
                             else:
-                                QMessageBox.warning(None, "Connection Error", 
-                                                  "Input port already connected! Each input can only connect to one output.")
+                                self.status_callback(
+                                    "Input port already connected - each input "
+                                    "can only connect to one output", 3000)
                         else:
-                            QMessageBox.warning(None, "Connection Error", 
-                                              "Invalid connection! Connect output to input.")
+                            self.status_callback(
+                                "Invalid connection - connect an output to an input", 3000)
                         break
             
             # Remove temporary line
@@ -869,7 +1189,12 @@ class ModuleLibraryWidget(QListWidget):
         self.modules = {}  # Module definitions
         self.setContextMenuPolicy(Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self.show_context_menu)
-    
+
+        # One reusable menu; only the action labels change per item
+        self._ctx_menu = QMenu(self)
+        self._view_action = self._ctx_menu.addAction("View Details")
+        self._delete_action = self._ctx_menu.addAction("Remove")
+
     def add_module_definition(self, name, inputs, outputs):
         """Add a module definition to the library"""
         self.modules[name] = {
@@ -889,19 +1214,17 @@ class ModuleLibraryWidget(QListWidget):
     
     def show_context_menu(self, position):
         """Show context menu for modules in library"""
-        menu = QMenu()
-        
         item = self.itemAt(position)
         if item:
             module_name = item.text()
-            view_action = menu.addAction(f"View {module_name} Details")
-            delete_action = menu.addAction(f"Remove {module_name}")
-            
-            action = menu.exec_(self.mapToGlobal(position))
-            
-            if action == view_action:
+            self._view_action.setText(f"View {module_name} Details")
+            self._delete_action.setText(f"Remove {module_name}")
+
+            action = self._ctx_menu.exec_(self.mapToGlobal(position))
+
+            if action == self._view_action:
                 self.show_module_details(module_name)
-            elif action == delete_action:
+            elif action == self._delete_action:
                 self.delete_module(module_name)
     
     def show_module_details(self, module_name):
@@ -942,9 +1265,16 @@ class SystemVerilogDesigner(QMainWindow):
         
         # Create the graphics view and scene
         self.canvas = DesignCanvas()
+        # Connection errors go to the status bar; a modal dialog mid-drag
+        # blocks the event loop and eats the mouse release
+        self.canvas.status_callback = self.statusBar().showMessage
         self.view = QGraphicsView(self.canvas)
         self.view.setRenderHint(QPainter.Antialiasing)
         self.view.setDragMode(QGraphicsView.RubberBandDrag)  # Enable selection rectangle
+        # Module children are cached rasters, so only the regions Qt knows
+        # changed need repainting, and no painter state is saved per item
+        self.view.setViewportUpdateMode(QGraphicsView.MinimalViewportUpdate)
+        self.view.setOptimizationFlag(QGraphicsView.DontSavePainterState, True)
         self.setCentralWidget(self.view)
         
         # Create module library panel
@@ -955,7 +1285,10 @@ class SystemVerilogDesigner(QMainWindow):
         
         # Create menus
         self.create_menus()
-    
+
+        # About dialog, built lazily on first use
+        self._about_box = None
+
     def create_module_library(self):
         """Create the module library panel"""
         self.module_library = ModuleLibraryWidget()
@@ -965,6 +1298,17 @@ class SystemVerilogDesigner(QMainWindow):
         dock.setWidget(self.module_library)
         self.addDockWidget(Qt.LeftDockWidgetArea, dock)
     
+    @staticmethod
+    def _sync_pair(src, dst, handler):
+        """Mirror src's value into dst with dst's signals blocked, then run
+        the handler once. The naive cross-connection re-emitted valueChanged
+        from the mirrored widget and ran the handler twice per tick."""
+        def on_change(value):
+            with QSignalBlocker(dst):
+                dst.setValue(value)
+            handler(value)
+        src.valueChanged.connect(on_change)
+
     def create_display_controls(self):
         """Create toolbar with display controls"""
         display_toolbar = QToolBar("Display Controls")
@@ -977,17 +1321,18 @@ class SystemVerilogDesigner(QMainWindow):
         self.text_length_slider.setRange(5, 50)
         self.text_length_slider.setValue(15)
         self.text_length_slider.setFixedWidth(150)
-        self.text_length_slider.valueChanged.connect(self.update_text_length)
         display_toolbar.addWidget(self.text_length_slider)
-        
+
         self.text_length_spinner = QSpinBox()
         self.text_length_spinner.setRange(5, 50)
         self.text_length_spinner.setValue(15)
-        self.text_length_spinner.valueChanged.connect(self.text_length_slider.setValue)
         display_toolbar.addWidget(self.text_length_spinner)
-        
-        self.text_length_slider.valueChanged.connect(self.text_length_spinner.setValue)
-        
+
+        self._sync_pair(self.text_length_slider, self.text_length_spinner,
+                        self.update_text_length)
+        self._sync_pair(self.text_length_spinner, self.text_length_slider,
+                        self.update_text_length)
+
         # Add spacing
         display_toolbar.addSeparator()
         
@@ -998,17 +1343,18 @@ class SystemVerilogDesigner(QMainWindow):
         self.port_spacing_slider.setRange(10, 30)
         self.port_spacing_slider.setValue(15)
         self.port_spacing_slider.setFixedWidth(150)
-        self.port_spacing_slider.valueChanged.connect(self.update_port_spacing)
         display_toolbar.addWidget(self.port_spacing_slider)
-        
+
         self.port_spacing_spinner = QSpinBox()
         self.port_spacing_spinner.setRange(10, 30)
         self.port_spacing_spinner.setValue(15)
-        self.port_spacing_spinner.valueChanged.connect(self.port_spacing_slider.setValue)
         display_toolbar.addWidget(self.port_spacing_spinner)
-        
-        self.port_spacing_slider.valueChanged.connect(self.port_spacing_spinner.setValue)
-        
+
+        self._sync_pair(self.port_spacing_slider, self.port_spacing_spinner,
+                        self.update_port_spacing)
+        self._sync_pair(self.port_spacing_spinner, self.port_spacing_slider,
+                        self.update_port_spacing)
+
         # Add spacing
         display_toolbar.addSeparator()
         
@@ -1109,15 +1455,15 @@ class SystemVerilogDesigner(QMainWindow):
     
     def update_text_length(self, value):
         """Update text length for all modules"""
+        # Each setter already invalidates its own geometry and raster, so
+        # the scene repaints just the touched rects - no full-canvas update
         for module in self.canvas.modules.values():
             module.set_max_text_length(value)
-        self.canvas.update()
-    
+
     def update_port_spacing(self, value):
         """Update port spacing for all modules"""
         for module in self.canvas.modules.values():
             module.set_port_spacing(value)
-        self.canvas.update()
     
     def zoom_in(self):
         """Zoom in the view"""
@@ -1136,7 +1482,7 @@ class SystemVerilogDesigner(QMainWindow):
         if not self.canvas.modules:
             return
         
-        self.view.fitInView(self.canvas.itemsBoundingRect(), Qt.KeepAspectRatio)
+        self.view.fitInView(self.canvas.items_bounding_rect_cached(), Qt.KeepAspectRatio)
     
     def new_design(self):
         """Clear the current design"""
@@ -1145,9 +1491,7 @@ class SystemVerilogDesigner(QMainWindow):
                                    QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         
         if reply == QMessageBox.Yes:
-            self.canvas.clear()
-            self.canvas.modules = {}
-            self.canvas.wires = []
+            self.canvas.clear_design()
     
     def load_module(self):
         """Load a SystemVerilog module from file"""
@@ -1174,16 +1518,13 @@ class SystemVerilogDesigner(QMainWindow):
             ports = self.module_library.modules[module_name]
             
             # Create a unique instance name
-            instance_name = module_name
-            count = 1
-            while instance_name in self.canvas.modules:
-                instance_name = f"{module_name}_{count}"
-                count += 1
-            
+            instance_name = self.canvas.next_instance_name(module_name)
+
             module = ModuleItem(instance_name, ports)
             self.canvas.addItem(module)
             self.canvas.modules[instance_name] = module
-            
+            self.canvas._dirty = True
+
             # Position module in center of view
             module.setPos(self.view.mapToScene(self.view.viewport().rect().center()))
     
@@ -1221,16 +1562,13 @@ class SystemVerilogDesigner(QMainWindow):
     
     def add_module_to_canvas(self, module_name, ports):
         """Add a module to the canvas with a unique instance name"""
-        instance_name = module_name
-        count = 1
-        while instance_name in self.canvas.modules:
-            instance_name = f"{module_name}_{count}"
-            count += 1
-        
+        instance_name = self.canvas.next_instance_name(module_name)
+
         module = ModuleItem(instance_name, ports)
         self.canvas.addItem(module)
         self.canvas.modules[instance_name] = module
-        
+        self.canvas._dirty = True
+
         # Position module in center of view
         module.setPos(self.view.mapToScene(self.view.viewport().rect().center()))
     
@@ -1250,14 +1588,30 @@ class SystemVerilogDesigner(QMainWindow):
             return
         
         # Create an image of the scene
-        rect = self.canvas.itemsBoundingRect().adjusted(-50, -50, 50, 50)
-        image = QImage(rect.size().toSize(), QImage.Format_ARGB32)
+        rect = self.canvas.items_bounding_rect_cached().adjusted(-50, -50, 50, 50)
+        size = rect.size().toSize()
+        image = QImage(size, QImage.Format_ARGB32)
         image.fill(Qt.white)
-        
-        painter = QPainter(image)
-        painter.setRenderHint(QPainter.Antialiasing)
-        self.canvas.render(painter, QRectF(image.rect()), rect)
-        painter.end()
+
+        # Render tile by tile into one reused scratch image; a single
+        # render() pass over a huge design spikes the painter's working
+        # set, while each tile here touches at most 2048x2048 pixels
+        tile = 2048
+        tile_image = QImage(min(tile, size.width()), min(tile, size.height()),
+                            QImage.Format_ARGB32)
+        compositor = QPainter(image)
+        for ty in range(0, size.height(), tile):
+            th = min(tile, size.height() - ty)
+            for tx in range(0, size.width(), tile):
+                tw = min(tile, size.width() - tx)
+                tile_image.fill(Qt.white)
+                painter = QPainter(tile_image)
+                painter.setRenderHint(QPainter.Antialiasing)
+                source = QRectF(rect.x() + tx, rect.y() + ty, tw, th)
+                self.canvas.render(painter, QRectF(0, 0, tw, th), source)
+                painter.end()
+                compositor.drawImage(tx, ty, tile_image, 0, 0, tw, th)
+        compositor.end()
         
         # Save the image
         if image.save(filename):
@@ -1282,39 +1636,73 @@ class SystemVerilogDesigner(QMainWindow):
         if not ok or not top_name:
             top_name = "top"
         
-        # Generate SystemVerilog code directly
-        sv_code = []
-        
+        # Stream straight to the destination file so the whole output never
+        # sits in memory at once
+        try:
+            with open(filename, "w", buffering=1 << 16) as f:
+                self._write_systemverilog(f, filename, top_name)
+
+            self.canvas._dirty = False
+            QMessageBox.information(self, "Code Generated",
+                                  f"SystemVerilog code generated and saved to {filename}")
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to save file: {str(e)}")
+
+    def _write_systemverilog(self, f, filename, top_name):
+        """Emit the top-level module for the current design to stream f"""
+        # Comment header with metadata
+        timestamp = QDateTime.currentDateTime().toString("yyyy-MM-dd HH:mm:ss")
+        f.write("//=============================================================================\n")
+        f.write(f"// File: {os.path.basename(filename)}\n")
+        f.write(f"// Date: {timestamp}\n")
+        f.write(f"// Description: Top level SystemVerilog module '{top_name}' generated by SystemVerilog Designer\n")
+        f.write("// Contains the following module instances:\n")
+        for module_name in self.canvas.modules:
+            f.write(f"//   - {module_name}\n")
+        f.write("//=============================================================================\n")
+        f.write("\n")  # Empty line after header
+
         # Module header
-        sv_code.append(f"module {top_name} (")
-        
+        f.write(f"module {top_name} (\n")
+
+        # Build the wire lookups once up front; the per-port loops below then
+        # do set/dict lookups instead of rescanning the wire list for every
+        # port of every module
+        connected_inputs = set()
+        wire_by_input = {}
+        wires_by_output = defaultdict(list)
+
+        # Memoized "[width]" prefix per (module, port): one dict probe per
+        # hit instead of the get()-then-index double lookup at every use
+        width_prefixes = {}
+
+        def _width_prefix(module, port):
+            key = (module, port)
+            prefix = width_prefixes.get(key)
+            if prefix is None:
+                width = module.port_widths.get(port, "")
+                prefix = f"[{width}]" if width else ""
+                width_prefixes[key] = prefix
+            return prefix
+
+        for wire in self.canvas.wires:
+            connected_inputs.add((wire.end_module, wire.end_port))
+            wire_by_input[(wire.end_module, wire.end_port)] = wire
+            wires_by_output[(wire.start_module, wire.start_port)].append(wire)
+
         # Collect external ports
         external_inputs = []
         external_outputs = []
-        
+
         for module in self.canvas.modules.values():
             for port in module.ports["inputs"]:
                 # Check if this port has a connection
-                has_connection = False
-                for wire in self.canvas.wires:
-                    if wire.end_module == module and wire.end_port == port:
-                        has_connection = True
-                        break
-                
-                if not has_connection:
-                    width = f"[{module.port_widths[port]}]" if module.port_widths.get(port, "") else ""
-                    external_inputs.append((f"{module.name}_{port}", width))
-            
+                if (module, port) not in connected_inputs:
+                    external_inputs.append((f"{module.name}_{port}", _width_prefix(module, port)))
+
             for port in module.ports["outputs"]:
-                has_connection = False
-                for wire in self.canvas.wires:
-                    if wire.start_module == module and wire.start_port == port:
-                        has_connection = True
-                        break
-                
-                if not has_connection:
-                    width = f"[{module.port_widths[port]}]" if module.port_widths.get(port, "") else ""
-                    external_outputs.append((f"{module.name}_{port}", width))
+                if (module, port) not in wires_by_output:
+                    external_outputs.append((f"{module.name}_{port}", _width_prefix(module, port)))
         
         # Add port declarations
         ports = []
@@ -1325,126 +1713,92 @@ class SystemVerilogDesigner(QMainWindow):
             ports.append(f"  output wire {width}{port}")
         
         if ports:
-            sv_code.append(",\n".join(ports))
+            f.write(",\n".join(ports))
+            f.write("\n")
         else:
             # No external ports - create a dummy port to make the code valid
-            sv_code.append("  // No external connections")
-        
-        sv_code.append(");")
+            f.write("  // No external connections\n")
+
+        f.write(");\n")
         
         # Internal wire declarations
         wire_names = {}
         
         for wire in self.canvas.wires:
-            start_qualname = f"{wire.start_module.name}_{wire.start_port}"
-            end_qualname = f"{wire.end_module.name}_{wire.end_port}"
-            wire_name = f"w_{start_qualname}_to_{end_qualname}"
+            # One format call instead of building the two qualnames first
+            wire_name = "w_{}_{}_to_{}_{}".format(
+                wire.start_module.name, wire.start_port,
+                wire.end_module.name, wire.end_port)
             wire_names[(wire.start_module, wire.start_port, wire.end_module, wire.end_port)] = wire_name
-            
+
             # Add width information if available
-            width = f"[{wire.start_module.port_widths[wire.start_port]}]" if wire.start_module.port_widths.get(wire.start_port, "") else ""
-            sv_code.append(f"  wire {width}{wire_name};")
-        
+            width = _width_prefix(wire.start_module, wire.start_port)
+            f.write(f"  wire {width}{wire_name};\n")
+
         # Add newline after wire declarations
         if self.canvas.wires:
-            sv_code.append("")
+            f.write("\n")
         
-        # Module instantiations
+        # Module instantiations. Resolve every instance name to its module
+        # type once rather than re-parsing the name inside the loop
+        module_types = {name: self.canvas.get_module_type(name)
+                        for name in self.canvas.modules}
+
         for module_name, module in self.canvas.modules.items():
-            # Get module type from the module_name (remove instance numbers)
-            module_type = self.canvas.get_module_type(module_name)
-            
-            sv_code.append(f"  {module_type} {module_name} (")
+            module_type = module_types[module_name]
+
+            f.write(f"  {module_type} {module_name} (\n")
             
             # Add port connections
             connections = []
             
             for port in module.ports["inputs"] + module.ports["outputs"]:
-                connected = False
-                
-                if port in module.ports["inputs"]:
-                    # Find wire coming into this input
-                    for wire in self.canvas.wires:
-                        if wire.end_module == module and wire.end_port == port:
-                            connected = True
-                            wire_name = wire_names[(wire.start_module, wire.start_port, wire.end_module, wire.end_port)]
-                            connections.append(f"    .{port}({wire_name})")
-                            break
-                
-                elif port in module.ports["outputs"]:
-                    # Find wire going from this output
-                    for wire in self.canvas.wires:
-                        if wire.start_module == module and wire.start_port == port:
-                            connected = True
-                            wire_name = wire_names[(wire.start_module, wire.start_port, wire.end_module, wire.end_port)]
-                            connections.append(f"    .{port}({wire_name})")
-                            break
-                
-                if not connected:
+                if port in module._inputs_set:
+                    # Wire coming into this input, if any
+                    wire = wire_by_input.get((module, port))
+                else:
+                    # First wire leaving this output, if any
+                    out_wires = wires_by_output.get((module, port))
+                    wire = out_wires[0] if out_wires else None
+
+                if wire is not None:
+                    wire_name = wire_names[(wire.start_module, wire.start_port, wire.end_module, wire.end_port)]
+                    connections.append(f"    .{port}({wire_name})")
+                else:
                     # Connect to external port
                     external_name = f"{module.name}_{port}"
                     connections.append(f"    .{port}({external_name})")
             
             if connections:
-                sv_code.append(",\n".join(connections))
+                f.write(",\n".join(connections))
+                f.write("\n")
             else:
-                sv_code.append("    // No connections")
-            
-            sv_code.append("  );")
-            sv_code.append("")  # Add newline after each module
-        
+                f.write("    // No connections\n")
+
+            f.write("  );\n")
+            f.write("\n")  # Add newline after each module
+
         # End module
-        sv_code.append("endmodule")
-        
-        # Add a comment header with metadata
-        timestamp = QDateTime.currentDateTime().toString("yyyy-MM-dd HH:mm:ss")
-        header = [
-            "//=============================================================================",
-            f"// File: {os.path.basename(filename)}",
-            f"// Date: {timestamp}",
-            f"// Description: Top level SystemVerilog module '{top_name}' generated by SystemVerilog Designer",
-            "// Contains the following module instances:",
-        ]
-        
-        for module_name in self.canvas.modules:
-            header.append(f"//   - {module_name}")
-        
-        header.append("//=============================================================================")
-        header.append("")  # Empty line after header
-        
-        # Insert header at the beginning
-        sv_code = header + sv_code
-        
-        # Write to file
-        try:
-            with open(filename, "w") as f:
-                f.write("\n".join(sv_code))
-            
-            QMessageBox.information(self, "Code Generated", 
-                                  f"SystemVerilog code generated and saved to {filename}")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to save file: {str(e)}")
+        f.write("endmodule")
     
     def show_about(self):
         """Show about dialog"""
-        about_text = """
-        <h1>SystemVerilog Module Designer</h1>
-        <p>A tool for designing SystemVerilog module connections graphically.</p>
-        <p>Features:</p>
-        <ul>
-            <li>Load existing SystemVerilog modules</li>
-            <li>Create connections with drag and drop</li>
-            <li>Generate top-level SystemVerilog file</li>
-            <li>Export design as image</li>
-        </ul>
-        <p>Version: 1.0</p>
-        """
-        
-        QMessageBox.about(self, "About SystemVerilog Module Designer", about_text)
+        # Build the dialog once and re-exec it; QMessageBox.about would
+        # construct and polish a fresh widget on every call
+        if self._about_box is None:
+            self._about_box = QMessageBox(
+                QMessageBox.Information,
+                "About SystemVerilog Module Designer",
+                _ABOUT_HTML, QMessageBox.Ok, self)
+            self._about_box.setTextFormat(Qt.RichText)
+
+        self._about_box.exec_()
     
     def closeEvent(self, event):
         """Handle window close event"""
-        if self.canvas.modules:
+        # Only prompt when there are unsaved changes; a clean close never
+        # builds the dialog
+        if self.canvas._dirty:
             reply = QMessageBox.question(self, "Exit", 
                                        "Are you sure you want to exit? Any unsaved changes will be lost.",
                                        QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
@@ -1457,18 +1811,37 @@ class SystemVerilogDesigner(QMainWindow):
 
 
 if __name__ == "__main__":
+    # Application attributes must be set before QApplication exists:
+    # shared GL contexts for the OpenGL viewport, and event compression
+    # so drag-to-connect doesn't flood the loop with mouse moves
+    QCoreApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
+    QCoreApplication.setAttribute(Qt.AA_CompressHighFrequencyEvents)
+    QCoreApplication.setAttribute(Qt.AA_CompressTabletEvents)
+
     app = QApplication(sys.argv)
-    
-    # Set application-wide font
-    font = QFont("Arial", 9)
-    app.setFont(font)
-    
+
+    # Set application-wide font (before the style, so Fusion polishes the
+    # widget tree once with the final metrics)
+    app.setFont(_app_font())
+
     # Set application style
     app.setStyle("Fusion")
     
     # Create and show main window
     designer = SystemVerilogDesigner()
-    designer.show()
-    
+
+    # Render the canvas through an OpenGL viewport so painting large
+    # designs lands on the GPU; GL surfaces need full-viewport updates
+    gl = QOpenGLWidget()
+    fmt = QSurfaceFormat()
+    fmt.setSamples(4)
+    gl.setFormat(fmt)
+    designer.view.setViewport(gl)
+    designer.view.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+
+    # Show on the first event-loop tick so Qt starts pumping platform
+    # events before the initial polish/paint instead of blocking on them
+    QTimer.singleShot(0, designer.show)
+
     # Start event loop
     sys.exit(app.exec_())
\ No newline at end of file